@@ -1,16 +1,70 @@
 from collections import OrderedDict as _OrderedDict
 from collections.abc import Sequence as _Sequence, Mapping as _Mapping
 from abc import ABCMeta, abstractmethod
+from copy import deepcopy as _deepcopy
+from functools import partial as _partial, wraps as _wraps
+from itertools import count as _count
+from numbers import Number as _Number
+from operator import (
+    attrgetter as _attrgetter,
+    methodcaller as _methodcaller
+)
+import re as _re
+from types import MemberDescriptorType as _MemberDescriptorType
 from uuid import UUID
+from weakref import (
+    WeakKeyDictionary as _WeakKeyDictionary,
+    WeakValueDictionary as _WeakValueDictionary
+)
 
 import jsonschema
 
+try:
+    from abc import get_cache_token as _get_cache_token
+except ImportError:  # pragma: no cover
+    # Python 3.3 keeps the same counter on ABCMeta without exposing it
+    def _get_cache_token():
+        return ABCMeta._abc_invalidation_counter
+
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover
+    fastjsonschema = None
+
+try:
+    import jsonschema_rs
+except ImportError:  # pragma: no cover
+    jsonschema_rs = None
+
 UUID_PATTERN = ("^[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[1-5][0-9a-fA-F]{3}-?"
                 "[89abAB][0-9a-fA-F]{3}-?[0-9a-fA-F]{12}$")
 
 
+def _cache_on_class(attribute):
+    """Returns a decorator for classmethods that stores the result on
+    each class under attribute, so it is computed once per class."""
+    def decorator(method):
+        @_wraps(method)
+        def wrapper(cls):
+            try:
+                return cls.__dict__[attribute]
+            except KeyError:
+                pass
+            result = method(cls)
+            setattr(cls, attribute, result)
+            return result
+        return wrapper
+    return decorator
+
+
+def _optional_validation(method):
+    """Marks a deserialize method accepting a validate keyword argument."""
+    method._optional_validation = True
+    return method
+
+
 class SerializableBase(metaclass=ABCMeta):
-    pass
+    __slots__ = ()
 
 
 class SimpleType(SerializableBase):
@@ -23,9 +77,12 @@ SimpleType.register(bool)
 SimpleType.register(str)
 SimpleType.register(UUID)
 
+# Types with the same schema share a single dict
+_NUMBER_SCHEMA = {'type': 'number'}
+
 SIMPLETYPE_SCHEMAS = {
-    int: {'type': 'number'},
-    float: {'type': 'number'},
+    int: _NUMBER_SCHEMA,
+    float: _NUMBER_SCHEMA,
     bool: {'type': 'boolean'},
     str: {'type': 'string'},
     UUID: {'type': 'string', 'pattern': UUID_PATTERN}
@@ -33,9 +90,20 @@ SIMPLETYPE_SCHEMAS = {
 
 SIMPLETYPE_SERIALIZERS = {UUID: str}
 
+# The exact types of the JSON values each simple type is deserialized from
+_SIMPLETYPE_JSON_TYPES = {
+    int: frozenset([int, float]),
+    float: frozenset([int, float]),
+    bool: frozenset([bool]),
+    str: frozenset([str]),
+    UUID: frozenset([str])
+}
+
 
 class Serializable(SerializableBase):
 
+    __slots__ = ()
+
     @staticmethod
     @abstractmethod
     def schema():
@@ -50,36 +118,470 @@ class Serializable(SerializableBase):
     def deserialize(cls, data):
         pass
 
-
-def schema(python_type: ABCMeta):
+    @classmethod
+    @_cache_on_class('_cached_validator')
+    def _validator(cls):
+        """Returns a validator for cls.schema(), compiled on first use."""
+        return _compile_validator(_shared_schema(cls))
+
+
+_type_kind_cache = _WeakKeyDictionary()
+_type_kind_cache_token = None
+
+
+def _type_kind(python_type):
+    """Returns 'serializable' or None for other types, caching the ABC
+    subclass checks per type. Simple types are looked up in
+    SIMPLETYPE_SCHEMAS before this is needed."""
+    global _type_kind_cache_token
+    # Registering any type with an ABC changes the token, and may change
+    # the kinds of types already cached
+    token = _get_cache_token()
+    if token != _type_kind_cache_token:
+        _type_kind_cache.clear()
+        _type_kind_cache_token = token
+    try:
+        return _type_kind_cache[python_type]
+    except KeyError:
+        pass
     if issubclass(python_type, Serializable):
-        return python_type.schema()  # type: ignore
-    elif issubclass(python_type, SimpleType):
+        kind = 'serializable'
+    else:
+        kind = None
+    _type_kind_cache[python_type] = kind
+    return kind
+
+
+def _copy_cached_schema(cls):
+    """Returns a copy of the schema cached by cls._schema(), which callers
+    are free to modify."""
+    return _deepcopy(cls._schema())
+
+
+def _shared_schema(python_type):
+    """Returns the schema of python_type, which may be shared with its
+    validator and the schemas nesting it, so must not be modified."""
+    if python_type in SIMPLETYPE_SCHEMAS:
         return SIMPLETYPE_SCHEMAS[python_type]
+    kind = _type_kind(python_type)
+    if kind == 'serializable':
+        method = python_type.schema  # type: ignore
+        if getattr(method, '__func__', None) is _copy_cached_schema:
+            return python_type._schema()  # type: ignore
+        return method()
     else:
         raise TypeError('type has no JSON schema')
 
 
+def schema(python_type: ABCMeta):
+    return _deepcopy(_shared_schema(python_type))
+
+
+# Drafts fastjsonschema implements; it assumes draft-07 for schemas not
+# declaring one, where jsonschema assumes the latest draft
+_FASTJSONSCHEMA_DRAFTS = frozenset([
+    'http://json-schema.org/draft-04/schema',
+    'http://json-schema.org/draft-04/schema#',
+    'http://json-schema.org/draft-06/schema',
+    'http://json-schema.org/draft-06/schema#',
+    'http://json-schema.org/draft-07/schema',
+    'http://json-schema.org/draft-07/schema#'
+])
+
+
+def _compile_backend_validator(json_schema):
+    """Compiles json_schema into a function validating data against it with
+    a JSON schema library.
+
+    fastjsonschema is used when installed and json_schema declares a draft
+    it implements, then jsonschema-rs, otherwise jsonschema. Whichever is
+    used, invalid data raises jsonschema.ValidationError. As with
+    jsonschema.validate(), formats are not checked and defaults are not
+    filled in.
+    """
+    draft = None
+    if isinstance(json_schema, dict):
+        draft = json_schema.get('$schema')
+    if (fastjsonschema is not None and isinstance(draft, str) and
+            draft in _FASTJSONSCHEMA_DRAFTS):
+        compiled = fastjsonschema.compile(
+            json_schema, use_default=False, use_formats=False
+        )
+
+        def validate(data):
+            try:
+                compiled(data)
+            except fastjsonschema.JsonSchemaValueException as error:
+                raise jsonschema.ValidationError(error.message) from error
+
+        return validate
+    if jsonschema_rs is not None:
+        validator = jsonschema_rs.validator_for(
+            json_schema, validate_formats=False
+        )
+
+        def validate(data):
+            try:
+                validator.validate(data)
+            except jsonschema_rs.ValidationError as error:
+                raise jsonschema.ValidationError(error.message) from error
+
+        return validate
+    validator_class = jsonschema.validators.validator_for(json_schema)
+    validator_class.check_schema(json_schema)
+    return validator_class(json_schema, format_checker=None).validate
+
+
+# Keywords the generated validators check themselves, and annotations they
+# can ignore as formats are not checked and defaults are not filled in
+_GENERATED_KEYWORDS = frozenset([
+    'type', 'pattern', 'properties', 'required', 'additionalProperties',
+    'items'
+])
+_ANNOTATION_KEYWORDS = frozenset([
+    'title', 'description', 'default', 'examples', 'format', '$comment'
+])
+_REFERENCE_KEYWORDS = frozenset(['$ref', '$recursiveRef', '$dynamicRef'])
+
+# Conditions under which a value fails a type check, with exact type checks
+# first to skip the slower isinstance() where possible
+_TYPE_FAILURES = {
+    'number': ('type({0}) is not int and type({0}) is not float and '
+               'not is_number({0})'),
+    'string': 'not isinstance({0}, str)',
+    'boolean': '{0} is not True and {0} is not False',
+    'array': 'not isinstance({0}, list)',
+    'object': 'not isinstance({0}, dict)'
+}
+_TYPE_GUARDS = {
+    'string': 'isinstance({0}, str)',
+    'array': 'isinstance({0}, list)',
+    'object': 'isinstance({0}, dict)'
+}
+_TYPE_KEYWORDS = {
+    'string': ('pattern',),
+    'array': ('items',),
+    'object': ('properties', 'required', 'additionalProperties')
+}
+
+
+def _is_number(value):
+    return not isinstance(value, bool) and isinstance(value, _Number)
+
+
+def _has_reference(json_schema):
+    """Returns True if json_schema refers to other parts of itself, which
+    would be lost if its subschemas were compiled separately."""
+    if isinstance(json_schema, dict):
+        return (not _REFERENCE_KEYWORDS.isdisjoint(json_schema) or
+                any(map(_has_reference, json_schema.values())))
+    elif isinstance(json_schema, list):
+        return any(map(_has_reference, json_schema))
+    return False
+
+
+def _is_generatable(json_schema):
+    """Returns True if a validator can be generated for json_schema itself,
+    without deferring to a JSON schema library."""
+    if not isinstance(json_schema, dict):
+        return False
+    if not set(json_schema) - _ANNOTATION_KEYWORDS <= _GENERATED_KEYWORDS:
+        return False
+    schema_type = json_schema.get('type', 'object')
+    # Lists of types, or anything else unusual, go to a library
+    if not (isinstance(schema_type, str) and schema_type in _TYPE_FAILURES):
+        return False
+    if not isinstance(json_schema.get('pattern', ''), str):
+        return False
+    properties = json_schema.get('properties', {})
+    required = json_schema.get('required', [])
+    additional = json_schema.get('additionalProperties', True)
+    if not isinstance(properties, dict):
+        return False
+    if not (isinstance(required, list) and
+            all(isinstance(name, str) for name in required)):
+        return False
+    if not (isinstance(additional, bool) or
+            isinstance(additional, dict) and not properties):
+        return False
+    return isinstance(json_schema.get('items', {}), dict)
+
+
+# CPython allows 20 nested loops and 100 levels of indentation in a
+# function, and each level of nesting takes an indent or two
+_MAX_GENERATED_INDENT = 10
+
+
+def _escape(text):
+    return text.replace('%', '%%')
+
+
+def _compile_validator(json_schema):
+    """Compiles json_schema into a function validating data against it.
+
+    Python code is generated for the keywords used by the schemas of this
+    module's types. Subschemas using any others are validated with
+    fastjsonschema when installed, then jsonschema-rs, otherwise
+    jsonschema. Either way, invalid data raises jsonschema.ValidationError.
+    As with jsonschema.validate(), formats are not checked and defaults
+    are not filled in.
+    """
+    if _has_reference(json_schema) or not _is_generatable(json_schema):
+        return _compile_backend_validator(json_schema)
+
+    namespace = {'ValidationError': jsonschema.ValidationError,
+                 'is_number': _is_number, 'missing': _MISSING}
+    lines = ['def validate(data):']
+    names = _count()
+
+    def add_raise(indent, message, value=None):
+        if value is not None:
+            message = '{!r} % ({},)'.format(message, value)
+        else:
+            message = repr(message)
+        lines.append('    ' * indent + 'raise ValidationError({})'.format(
+            message
+        ))
+
+    def add_checks(subschema, value, indent):
+        prefix = '    ' * indent
+        if not _is_generatable(subschema):
+            name = 'fallback_{}'.format(next(names))
+            namespace[name] = _compile_backend_validator(subschema)
+            lines.append('{}{}({})'.format(prefix, name, value))
+            return
+        if indent > _MAX_GENERATED_INDENT:
+            # Deeper checks go in a function of their own, keeping within
+            # the limits on nested loops and indentation
+            name = 'nested_{}'.format(next(names))
+            namespace[name] = _compile_validator(subschema)
+            lines.append('{}{}({})'.format(prefix, name, value))
+            return
+        schema_type = subschema.get('type')
+        if schema_type is not None:
+            lines.append(prefix + 'if {}:'.format(
+                _TYPE_FAILURES[schema_type].format(value)
+            ))
+            add_raise(indent + 1, '%r is not of type {!r}'.format(
+                schema_type
+            ), value)
+        for instance_type, keywords in _TYPE_KEYWORDS.items():
+            if not any(keyword in subschema for keyword in keywords):
+                continue
+            if schema_type is None:
+                # Keywords only apply to values of the matching type
+                lines.append(prefix + 'if {}:'.format(
+                    _TYPE_GUARDS[instance_type].format(value)
+                ))
+                add_type_checks(instance_type, subschema, value, indent + 1)
+            elif schema_type == instance_type:
+                add_type_checks(instance_type, subschema, value, indent)
+
+    def add_block(subschema, value, indent):
+        start = len(lines)
+        add_checks(subschema, value, indent)
+        if len(lines) == start:
+            lines.append('    ' * indent + 'pass')
+
+    def add_type_checks(instance_type, subschema, value, indent):
+        prefix = '    ' * indent
+        start = len(lines)
+        if instance_type == 'string':
+            pattern = subschema['pattern']
+            name = 'search_{}'.format(next(names))
+            namespace[name] = _re.compile(pattern).search
+            lines.append(prefix + 'if not {}({}):'.format(name, value))
+            add_raise(indent + 1, '%r does not match {!r}'.format(
+                _escape(pattern)
+            ), value)
+        elif instance_type == 'array':
+            item = 'item_{}'.format(next(names))
+            lines.append(prefix + 'for {} in {}:'.format(item, value))
+            add_block(subschema['items'], item, indent + 1)
+        else:
+            add_object_checks(subschema, value, indent)
+        if len(lines) == start:
+            lines.append(prefix + 'pass')
+
+    def add_object_checks(subschema, value, indent):
+        prefix = '    ' * indent
+        properties = subschema.get('properties', {})
+        required = subschema.get('required', [])
+        additional = subschema.get('additionalProperties', True)
+        for name in required:
+            if name not in properties:
+                lines.append(prefix + 'if {!r} not in {}:'.format(
+                    name, value
+                ))
+                add_raise(indent + 1, '{!r} is a required property'.format(
+                    name
+                ))
+        for name, property_schema in properties.items():
+            item = 'value_{}'.format(next(names))
+            lines.append(prefix + '{} = {}.get({!r}, missing)'.format(
+                item, value, name
+            ))
+            if name in required:
+                lines.append(prefix + 'if {} is missing:'.format(item))
+                add_raise(indent + 1, '{!r} is a required property'.format(
+                    name
+                ))
+                add_checks(property_schema, item, indent)
+            else:
+                lines.append(prefix + 'if {} is not missing:'.format(item))
+                add_block(property_schema, item, indent + 1)
+        if additional is False:
+            known = 'known_{}'.format(next(names))
+            namespace[known] = frozenset(properties)
+            lines.append(prefix + 'if not {}.keys() <= {}:'.format(
+                value, known
+            ))
+            add_raise(indent + 1, 'Additional properties are not allowed '
+                      '(%r were unexpected)', 'set({}) - {}'.format(
+                          value, known
+                      ))
+        elif isinstance(additional, dict):
+            item = 'item_{}'.format(next(names))
+            lines.append(prefix + 'for {} in {}.values():'.format(
+                item, value
+            ))
+            add_block(additional, item, indent + 1)
+
+    add_block(json_schema, 'data', 1)
+    exec('\n'.join(lines), namespace)
+    return namespace['validate']
+
+
+_simpletype_validators = {}
+
+
+def _simpletype_validator(python_type):
+    """Returns a validator for a simple type, compiled once per type.
+
+    Serializable classes keep their own validator, see
+    Serializable._validator().
+    """
+    try:
+        return _simpletype_validators[python_type]
+    except KeyError:
+        pass
+    validator = _compile_validator(_shared_schema(python_type))
+    _simpletype_validators[python_type] = validator
+    return validator
+
+
 def serialize(obj: SerializableBase):
-    if isinstance(obj, Serializable):
+    obj_type = type(obj)
+    if (obj_type is int or obj_type is float or obj_type is bool or
+            obj_type is str):
+        return obj
+    # Exact simple types with a serializer skip the ABC isinstance() checks
+    serializer = SIMPLETYPE_SERIALIZERS.get(obj_type)
+    if serializer is not None:
+        return serializer(obj)
+    elif isinstance(obj, Serializable):
         return obj.serialize()
     elif isinstance(obj, SimpleType):
-        serializer = SIMPLETYPE_SERIALIZERS.get(type(obj), lambda x: x)
-        return serializer(obj)
+        return obj
     else:
         raise TypeError('object is not serializable')
 
 
-def deserialize(data, python_type: ABCMeta):
-    if issubclass(python_type, Serializable):
-        return python_type.deserialize(data)  # type: ignore
-    elif issubclass(python_type, SimpleType):
-        jsonschema.validate(data, schema(python_type))
+# Simple types whose values are JSON values themselves
+_JSON_NATIVE_TYPES = frozenset(
+    python_type for python_type in SIMPLETYPE_SCHEMAS
+    if python_type not in SIMPLETYPE_SERIALIZERS
+)
+
+
+def deserialize(data, python_type: ABCMeta, validate=True):
+    # Data already exactly of such a type is valid and needs no conversion
+    if type(data) is python_type and python_type in _JSON_NATIVE_TYPES:
+        return data
+    if python_type in SIMPLETYPE_SCHEMAS:
+        if validate:
+            _simpletype_validator(python_type)(data)
+        elif type(data) not in _SIMPLETYPE_JSON_TYPES[python_type]:
+            raise TypeError('cannot deserialize {!r} to {}'.format(
+                data, python_type
+            ))
         return python_type(data)
+    kind = _type_kind(python_type)
+    if kind == 'serializable':
+        if validate:
+            return python_type.deserialize(data)  # type: ignore
+        return _item_deserializer(python_type, validated=False)(data)
     else:
         raise TypeError('cannot deserialize to this type')
 
 
+def _item_serializer(python_type):
+    """Returns a serializer for values of python_type, or None if the values
+    serialize to themselves."""
+    if python_type in SIMPLETYPE_SCHEMAS:
+        return SIMPLETYPE_SERIALIZERS.get(python_type)
+    elif issubclass(python_type, Serializable):
+        return _methodcaller('serialize')
+    else:
+        return serialize
+
+
+def _simpletype_deserializer(python_type):
+    """Returns a deserializer converting unvalidated JSON values to
+    python_type, which leaves values of any other JSON type unconverted for
+    the type checks of the container or Object receiving them to reject."""
+    json_types = _SIMPLETYPE_JSON_TYPES[python_type]
+
+    def deserialize_value(data):
+        if type(data) in json_types:
+            return python_type(data)
+        return data
+
+    return deserialize_value
+
+
+def _item_deserializer(python_type, validated=True):
+    """Returns a deserializer for values of python_type, which are already
+    validated unless validated is False."""
+    if python_type in SIMPLETYPE_SCHEMAS:
+        if validated:
+            return python_type
+        return _simpletype_deserializer(python_type)
+    elif issubclass(python_type, Serializable):
+        # Values have been validated with the enclosing schema, so skip
+        # validating them again where the deserializer allows it
+        method = python_type.deserialize  # type: ignore
+        if getattr(method, '_optional_validation', False):
+            return _partial(method, validate=False)
+        return method
+    else:
+        return _partial(deserialize, python_type=python_type,
+                        validate=False)
+
+
+_MISSING = object()
+
+
+def _specializable(method):
+    """Marks a method the class's metaclass may replace with generated code
+    specialized to each subclass."""
+    method._specializable = True
+    return method
+
+
+def _compile_method(cls, name, lines, namespace):
+    exec('\n'.join(lines), namespace)
+    method = _specializable(namespace[name])
+    method.__qualname__ = '{}.{}'.format(cls.__qualname__, name)
+    return method
+
+
+def _overrides(cls, name):
+    """Returns True if name is defined by more than one class in the MRO
+    of cls, so the library's own definition has been overridden."""
+    return sum(name in vars(klass) for klass in cls.__mro__) > 1
+
+
 def _check_serializable_type(python_type):
     if not isinstance(python_type, type):
         raise TypeError('{} is not a type'.format(python_type))
@@ -93,27 +595,63 @@ class ContainerMeta(ABCMeta):
         if container_type is not None:
             _check_serializable_type(container_type)
         cls = super().__new__(metacls, name, bases, classdict)
-        cls._subclass_cache = {}
+        # Generated subclasses are reused while referenced, so List[T] is
+        # List[T], but can be collected once nothing refers to them
+        cls._subclass_cache = _WeakValueDictionary()
         cls._container_type = (container_type or
                                getattr(cls, '_container_type', None))
+        # Entries and keys may only be checked by type in bulk while the
+        # per-entry checks are the library's own
+        cls._bulk_check_entries = not _overrides(cls, '_check_type')
+        cls._bulk_check_keys = not _overrides(cls, '_check_key_type')
+        if container_type is not None:
+            cls._entry_type_error = 'entries must be of type {}'.format(
+                container_type
+            )
+            # Resolve how entries are (de)serialized once, rather than
+            # dispatching on every entry
+            cls._serialize_item = staticmethod(
+                _item_serializer(container_type)
+            )
+            cls._deserialize_item = staticmethod(
+                _item_deserializer(container_type)
+            )
+            cls._deserialize_unvalidated_item = staticmethod(
+                _item_deserializer(container_type, validated=False)
+            )
+            # Replace generic methods with versions specialized to the
+            # container type, as ObjectMeta does for attributes; they
+            # inline the default checks, so are not used if a class
+            # overrides either check
+            method_generators = cls._method_generators
+            if not (cls._bulk_check_entries and cls._bulk_check_keys):
+                method_generators = ()
+            for method_name, generate in method_generators:
+                method = getattr(cls, method_name)
+                if (method_name not in classdict and
+                        getattr(method, '_specializable', False)):
+                    setattr(cls, method_name, generate(cls))
         return cls
 
     def __init__(self, *args, **kwargs):
         pass
 
     def __getitem__(self, container_type):
-        _check_serializable_type(container_type)
         if self._container_type is not None:
             raise TypeError(
                 'container type already set as {}'.format(self._container_type)
             )
+        # Only valid types are cached, so only check the type on a miss
         try:
             cls = self._subclass_cache[container_type]
         except KeyError:
+            _check_serializable_type(container_type)
             name = '{}[{}]'.format(self.__name__, container_type.__name__)
+            # Everything else is inherited, so the class dict can stay small
+            classdict = {'__module__': self.__module__,
+                         '__doc__': self.__doc__}
             cls = self.__class__(
-                name, (self,) + self.__bases__, dict(self.__dict__),
-                container_type=container_type
+                name, (self,), classdict, container_type=container_type
             )
             self._subclass_cache[container_type] = cls
         return cls
@@ -121,13 +659,19 @@ class ContainerMeta(ABCMeta):
 
 class ContainerBase(Serializable, metaclass=ContainerMeta):
 
+    _method_generators = ()
+
     def __init__(self, *args, **kwargs):
-        if self._container_type is None:
+        self._check_container_type()
+        super().__init__(*args, **kwargs)
+
+    @classmethod
+    def _check_container_type(cls):
+        if cls._container_type is None:
             raise TypeError(
                 'container {} has no inner type - use square brackets to set'
-                .format(self.__class__.__name__)
+                .format(cls.__name__)
             )
-        super().__init__(*args, **kwargs)
 
     def __repr__(self):
         return '{}({})'.format(self.__class__.__name__, super().__repr__())
@@ -135,17 +679,46 @@ class ContainerBase(Serializable, metaclass=ContainerMeta):
     @classmethod
     def _check_type(cls, item):
         if not isinstance(item, cls._container_type):
-            raise TypeError('entries must be of type {}'.format(
-                cls._container_type
-            ))
+            raise TypeError(cls._entry_type_error)
+
+    @classmethod
+    def _check_types(cls, items):
+        # Checking each distinct entry type once keeps the loop over the
+        # entries in C; only fall back to per-entry checks on a mismatch
+        if cls._bulk_check_entries:
+            container_type = cls._container_type
+            for item_type in set(map(type, items)):
+                if not issubclass(item_type, container_type):
+                    break
+            else:
+                return
+        for item in items:
+            cls._check_type(item)
+
+    @classmethod
+    def _is_own_serialization(cls, values):
+        """Returns True if values are all exactly of a container type that
+        serializes to itself, so need no deserializing."""
+        return (cls._serialize_item is None and
+                set(map(type, values)) <= {cls._container_type})
+
+    @classmethod
+    def _has_checked_entries(cls, other, container_class):
+        """Returns True if other is a container_class whose entries are
+        already known to be valid entries of cls, which can only be so while
+        cls checks entries and keys by type alone."""
+        return (cls._bulk_check_entries and cls._bulk_check_keys and
+                isinstance(other, container_class) and
+                other._container_type is not None and
+                issubclass(other._container_type, cls._container_type))
 
 
 class List(ContainerBase, list):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        for item in self:
-            self._check_type(item)
+        if not (args and self._has_checked_entries(args[0], List)):
+            self._check_types(self)
 
     def __setitem__(self, index, value):
         self._check_type(value)
@@ -155,57 +728,183 @@ class List(ContainerBase, list):
         self._check_type(value)
         super().insert(index, value)
 
+    def append(self, value):
+        self._check_type(value)
+        super().append(value)
+
+    def extend(self, values):
+        if not self._has_checked_entries(values, List):
+            values = list(values)
+            self._check_types(values)
+        super().extend(values)
+
+    def __iadd__(self, values):
+        self.extend(values)
+        return self
+
+    schema = classmethod(_copy_cached_schema)
+
     @classmethod
-    def schema(cls):
+    @_cache_on_class('_cached_schema')
+    def _schema(cls):
         return {
             'type': 'array',
-            'items': schema(cls._container_type)
+            'items': _shared_schema(cls._container_type)
         }
 
     def serialize(self):
-        return [serialize(item) for item in self]
+        if self._serialize_item is None:
+            return list.copy(self)
+        return list(map(self._serialize_item, self))
 
     @classmethod
-    def deserialize(cls, data: _Sequence):
-        jsonschema.validate(data, cls.schema())
-        return cls(deserialize(entry, cls._container_type) for entry in data)
+    @_optional_validation
+    def deserialize(cls, data: _Sequence, validate=True):
+        cls._check_container_type()
+        if validate:
+            cls._validator()(data)
+        elif not isinstance(data, list):
+            # Unvalidated data may be any iterable, only to be read once
+            data = list(data)
+        if cls._is_own_serialization(data):
+            items = data
+            checked = True
+        elif validate:
+            items = map(cls._deserialize_item, data)
+            checked = True
+        else:
+            items = map(cls._deserialize_unvalidated_item, data)
+            checked = False
+        if (not checked or cls.__init__ is not List.__init__ or
+                not cls._bulk_check_entries):
+            # Unvalidated entries may be of the wrong type, and subclasses
+            # may set up state or check entries themselves
+            return cls(items)
+        # The entries are all known to be of the container type, so skip
+        # the per-entry checks in __init__
+        obj = cls.__new__(cls)
+        list.extend(obj, items)
+        return obj
+
+
+def _generate_dict_setitem(cls):
+    container_type = cls._container_type
+    namespace = {'cls': cls, 'generic': Dict.__setitem__,
+                 'container_type': container_type,
+                 'setitem': super(Dict, cls).__setitem__}
+    lines = [
+        'def __setitem__(self, key, value):',
+        '    if self.__class__ is not cls:',
+        '        return generic(self, key, value)',
+        '    if type(key) is not str and not isinstance(key, str):',
+        "        raise TypeError('keys must be of type str')",
+        '    if (type(value) is not container_type and',
+        '            not isinstance(value, container_type)):',
+        '        raise TypeError({!r})'.format(cls._entry_type_error),
+        '    setitem(self, key, value)'
+    ]
+    return _compile_method(cls, '__setitem__', lines, namespace)
 
 
 class Dict(ContainerBase, dict):
 
+    _method_generators = (('__setitem__', _generate_dict_setitem),)
+
     @staticmethod
     def _check_key_type(key):
         if not isinstance(key, str):
             raise TypeError('keys must be of type str')
 
+    @classmethod
+    def _check_key_types(cls, keys):
+        # As with the values in _check_types(), only check keys one by one
+        # if a distinct key type is not a str
+        if cls._bulk_check_keys:
+            for key_type in set(map(type, keys)):
+                if not issubclass(key_type, str):
+                    break
+            else:
+                return
+        for key in keys:
+            cls._check_key_type(key)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        for key, value in self.items():
-            self._check_key_type(key)
-            self._check_type(value)
+        if (len(args) == 1 and not kwargs and
+                self._has_checked_entries(args[0], Dict)):
+            return
+        self._check_key_types(self)
+        self._check_types(self.values())
 
+    @_specializable
     def __setitem__(self, key, value):
         self._check_key_type(key)
         self._check_type(value)
         super().__setitem__(key, value)
 
+    def update(self, *args, **kwargs):
+        if (len(args) == 1 and not kwargs and
+                self._has_checked_entries(args[0], Dict)):
+            items = args[0]
+        else:
+            items = dict(*args, **kwargs)
+            self._check_key_types(items)
+            self._check_types(items.values())
+        super().update(items)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    schema = classmethod(_copy_cached_schema)
+
     @classmethod
-    def schema(cls):
+    @_cache_on_class('_cached_schema')
+    def _schema(cls):
         return {
             'type': 'object',
-            'additionalProperties': schema(cls._container_type)
+            'additionalProperties': _shared_schema(cls._container_type)
         }
 
     def serialize(self):
-        return {key: serialize(value) for key, value in self.items()}
+        serialize_item = self._serialize_item
+        if serialize_item is None:
+            return dict.copy(self)
+        return {key: serialize_item(value) for key, value in self.items()}
 
     @classmethod
-    def deserialize(cls, data: _Mapping):
-        jsonschema.validate(data, cls.schema())
-        return cls({
-            key: deserialize(value, cls._container_type)
-            for key, value in data.items()
-        })
+    @_optional_validation
+    def deserialize(cls, data: _Mapping, validate=True):
+        cls._check_container_type()
+        if validate:
+            cls._validator()(data)
+        if cls._is_own_serialization(data.values()):
+            items = data
+            checked = True
+        else:
+            if validate:
+                deserialize_item = cls._deserialize_item
+            else:
+                deserialize_item = cls._deserialize_unvalidated_item
+            items = {key: deserialize_item(value)
+                     for key, value in data.items()}
+            checked = validate
+        if (not checked or cls.__init__ is not Dict.__init__ or
+                not (cls._bulk_check_entries and cls._bulk_check_keys)):
+            # Unvalidated values may be of the wrong type, and subclasses
+            # may set up state or check entries themselves
+            return cls(items)
+        # The schema does not constrain keys, but has validated the values,
+        # which are built as the container type
+        cls._check_key_types(items)
+        obj = cls.__new__(cls)
+        dict.update(obj, items)
+        return obj
 
 
 def _is_descriptor(obj):
@@ -236,6 +935,8 @@ class EnumDict(dict):
 
 class EnumMember(Serializable):
 
+    __slots__ = ('_enum', 'name', 'value', '__weakref__')
+
     def __init__(self, enum, name, value):
         self._enum = enum
         self.name = name
@@ -275,7 +976,8 @@ class EnumMeta(ABCMeta):
         cls._member_definitions = member_defs
 
         name_map = _OrderedDict()
-        value_map = _OrderedDict()
+        value_map = {}
+        unhashable_members = []
         for name, value in member_defs.items():
             member = EnumMember(cls, name, value)
             name_map[name] = member
@@ -284,10 +986,19 @@ class EnumMeta(ABCMeta):
                     raise ValueError('enumeration values must be unique')
                 value_map[value] = member
             except TypeError:
-                # Unhashable value, skip
-                pass
+                # Unhashable value, found by scanning in from_value()
+                unhashable_members.append(member)
         cls._name_map = name_map
         cls._value_map = value_map
+        cls._unhashable_members = tuple(unhashable_members)
+
+        # Make members plain class attributes, so that looking them up does
+        # not go through __getattr__, unless that would shadow a method
+        for name, member in name_map.items():
+            if not hasattr(metacls, name) and isinstance(
+                getattr(cls, name, member), EnumMember
+            ):
+                setattr(cls, name, member)
 
         return cls
 
@@ -315,8 +1026,8 @@ class EnumMeta(ABCMeta):
         try:
             return self._value_map[value]
         except TypeError:
-            # Unhashable value
-            for member in self._name_map.values():
+            # Unhashable data, such as lists, only matches unhashable values
+            for member in self._unhashable_members:
                 if member.value == value:
                     return member
             else:
@@ -327,28 +1038,35 @@ class EnumMeta(ABCMeta):
 
 class Enum(Serializable, metaclass=EnumMeta):
 
+    schema = classmethod(_copy_cached_schema)
+
     @classmethod
-    def schema(cls):
+    @_cache_on_class('_cached_schema')
+    def _schema(cls):
         return {'enum': [serialize(member) for member in cls]}
 
     def serialize(self):
         raise TypeError('cannot serialize an enum, only its members')
 
     @classmethod
-    def deserialize(cls, data):
-        jsonschema.validate(data, cls.schema())
+    @_optional_validation
+    def deserialize(cls, data, validate=True):
+        if validate:
+            cls._validator()(data)
         return cls.from_value(data)
 
 
 class Attribute:
 
+    __slots__ = ('type', 'optional', '__weakref__')
+
     def __init__(self, type, optional=False):
         _check_serializable_type(type)
         self.type = type
         self.optional = bool(optional)
 
     def __repr__(self):
-        return '{}(type={}, optional={})'.format(
+        return '%s(type=%s, optional=%s)' % (
             self.__class__.__name__, self.type, self.optional
         )
 
@@ -365,6 +1083,150 @@ class ObjectDict(dict):
         super().__setitem__(key, value)
 
 
+def _generate_init(cls):
+    namespace = {'cls': cls, 'generic': Object.__init__,
+                 'missing': _MISSING}
+    lines = [
+        'def __init__(self, **kwargs):',
+        '    if self.__class__ is not cls:',
+        '        return generic(self, **kwargs)'
+    ]
+    for index, (name, jsattr) in enumerate(cls._object_attributes_items):
+        type_name = 'type_{}'.format(index)
+        namespace[type_name] = jsattr.type
+        check = ('type(value) is not {0} and not isinstance(value, {0})'
+                 .format(type_name))
+        if jsattr.optional:
+            check = 'value is not None and ' + check
+        message = cls._object_type_errors[name]
+        if jsattr.optional:
+            lines += [
+                '    value = kwargs.pop({!r}, None)'.format(name),
+                '    if {}:'.format(check),
+                '        raise TypeError({!r})'.format(message)
+            ]
+        else:
+            missing_message = "{} missing a required argument '{}'".format(
+                cls.__name__, name
+            )
+            lines += [
+                '    value = kwargs.pop({!r}, missing)'.format(name),
+                '    if value is missing:',
+                '        raise TypeError({!r})'.format(missing_message),
+                '    elif {}:'.format(check),
+                '        raise TypeError({!r})'.format(message)
+            ]
+        # Store straight into the slot where there is one, bypassing the
+        # checks in Object.__setattr__ which have been done inline
+        descriptor = getattr(cls, name, None)
+        if isinstance(descriptor, _MemberDescriptorType):
+            namespace['store_{}'.format(index)] = descriptor.__set__
+            lines.append('    store_{}(self, value)'.format(index))
+        else:
+            lines.append('    self.__dict__[{!r}] = value'.format(name))
+    # Every known keyword has been popped, so any left over are unexpected
+    lines += [
+        '    if kwargs:',
+        '        raise TypeError({!r}.format(set(kwargs)))'.format(
+            '{} got unexpected keyword argument(s) {{}}'.format(cls.__name__)
+        )
+    ]
+    return _compile_method(cls, '__init__', lines, namespace)
+
+
+def _generate_repr(cls):
+    namespace = {'cls': cls, 'generic': Object.__repr__}
+    # A single %-format of one constant template builds the whole repr
+    parts = ['{}=%r'.format(name) for name in cls._object_attributes_names]
+    template = '{}({})'.format(cls.__name__, ', '.join(parts))
+    values = ''.join('self.{}, '.format(name)
+                     for name in cls._object_attributes_names)
+    lines = [
+        'def __repr__(self):',
+        '    if self.__class__ is not cls:',
+        '        return generic(self)',
+        '    return {!r} % ({})'.format(template, values)
+    ]
+    return _compile_method(cls, '__repr__', lines, namespace)
+
+
+def _serialize_expression(python_type, value, namespace, index):
+    """Returns source serializing the value expression for python_type."""
+    if python_type in SIMPLETYPE_SCHEMAS:
+        serializer = SIMPLETYPE_SERIALIZERS.get(python_type)
+        if serializer is None:
+            return value
+    elif issubclass(python_type, Serializable):
+        return '{}.serialize()'.format(value)
+    else:
+        serializer = serialize
+    serializer_name = 'serialize_{}'.format(index)
+    namespace[serializer_name] = serializer
+    return '{}({})'.format(serializer_name, value)
+
+
+def _generate_serialize(cls):
+    namespace = {'cls': cls, 'generic': Object.serialize}
+    lines = [
+        'def serialize(self):',
+        '    if self.__class__ is not cls:',
+        '        return generic(self)'
+    ]
+    # Required attributes up to the first optional one go in a single dict
+    # display; the rest are stored in order to keep the key order
+    leading = []
+    statements = []
+    for index, (name, jsattr) in enumerate(cls._object_attributes_items):
+        if jsattr.optional:
+            expression = _serialize_expression(
+                jsattr.type, 'value', namespace, index
+            )
+            statements += [
+                '    value = self.{}'.format(name),
+                '    if value is not None:',
+                '        properties[{!r}] = {}'.format(name, expression)
+            ]
+        else:
+            expression = _serialize_expression(
+                jsattr.type, 'self.' + name, namespace, index
+            )
+            if statements:
+                statements.append(
+                    '    properties[{!r}] = {}'.format(name, expression)
+                )
+            else:
+                leading.append('{!r}: {}'.format(name, expression))
+    lines.append('    properties = {{{}}}'.format(', '.join(leading)))
+    lines += statements
+    lines.append('    return properties')
+    return _compile_method(cls, 'serialize', lines, namespace)
+
+
+def _generate_eq(cls):
+    namespace = {'cls': cls, 'generic': Object.__eq__}
+    self_values = ''.join('self.{}, '.format(name)
+                          for name in cls._object_attributes_names)
+    other_values = ''.join('other.{}, '.format(name)
+                           for name in cls._object_attributes_names)
+    lines = [
+        'def __eq__(self, other):',
+        '    if self.__class__ is not cls:',
+        '        return generic(self, other)',
+        '    if type(other) is not cls:',
+        '        return False',
+        '    return ({}) == ({})'.format(self_values, other_values)
+    ]
+    return _compile_method(cls, '__eq__', lines, namespace)
+
+
+_METHOD_GENERATORS = (
+    ('__init__', _generate_init),
+    ('__repr__', _generate_repr),
+    ('__eq__', _generate_eq),
+    ('serialize', _generate_serialize)
+)
+
+
 class ObjectMeta(ABCMeta):
 
     @classmethod
@@ -372,35 +1234,118 @@ class ObjectMeta(ABCMeta):
         return ObjectDict()
 
     def __new__(metacls, name, bases, classdict):
+        use_dict = classdict.get('_use_dict', False) or any(
+            getattr(base, '_use_dict', False) for base in bases
+        )
+        if not use_dict:
+            slots = classdict.get('__slots__', tuple(classdict.attributes))
+            slots = [slots] if isinstance(slots, str) else list(slots)
+            # Store attributes in slots; the Attribute definitions are kept
+            # in _object_attributes and would otherwise clash with them
+            for attribute_name in classdict.attributes:
+                if attribute_name in slots:
+                    del classdict[attribute_name]
+            # Attributes left without a slot, or whose inherited slot is
+            # shadowed by a class attribute, are stored in a __dict__
+            attribute_names = set(classdict.attributes)
+            for base in bases:
+                attribute_names.update(getattr(base, '_object_attributes', ()))
+            if (any(name in classdict for name in attribute_names) and
+                    not any(base.__dictoffset__ for base in bases) and
+                    '__dict__' not in slots):
+                slots.append('__dict__')
+            classdict['__slots__'] = tuple(slots)
+
         cls = super().__new__(metacls, name, bases, classdict)
 
         attributes = _OrderedDict()
         attributes.update(getattr(cls, '_object_attributes', {}))
         attributes.update(classdict.attributes)
         cls._object_attributes = attributes
+        # Tuples are cheaper to iterate than the OrderedDict on hot paths
+        cls._object_attributes_items = tuple(attributes.items())
+        cls._object_attributes_names = tuple(attributes)
+        cls._object_attributes_frozenset = frozenset(attributes)
+        # Gets all attribute values in one call, though attrgetter needs at
+        # least one name
+        cls._object_values = staticmethod(
+            _attrgetter(*attributes) if attributes else lambda obj: ()
+        )
+        cls._object_type_errors = {
+            name: ('{} must be a {} or None' if jsattr.optional
+                   else '{} must be a {}').format(name, jsattr.type)
+            for name, jsattr in attributes.items()
+        }
+        cls._object_validators = tuple(
+            (name, jsattr.type, jsattr.optional, cls._object_type_errors[name])
+            for name, jsattr in attributes.items()
+        )
+        cls._object_serializers = tuple(
+            (name, jsattr.optional, _item_serializer(jsattr.type))
+            for name, jsattr in attributes.items()
+        )
+        cls._object_deserializers = {
+            name: _item_deserializer(jsattr.type)
+            for name, jsattr in attributes.items()
+        }
+        cls._object_unvalidated_deserializers = {
+            name: _item_deserializer(jsattr.type, validated=False)
+            for name, jsattr in attributes.items()
+        }
+        # Values may only be stored without calling __setattr__ when no
+        # class besides Object overrides it, Object's being the one always
+        # defined below object in the MRO
+        cls._object_direct_store = sum(
+            '__setattr__' in vars(klass) for klass in cls.__mro__[:-1]
+        ) == 1
+
+        # Replace the generic Object methods with versions unrolled over
+        # this class's attributes, unless the class defines its own
+        for method_name, generate in _METHOD_GENERATORS:
+            if method_name == '__init__' and not cls._object_direct_store:
+                continue
+            method = getattr(cls, method_name)
+            if (method_name not in classdict and
+                    getattr(method, '_specializable', False)):
+                setattr(cls, method_name, generate(cls))
 
         return cls
 
 
 class Object(Serializable, metaclass=ObjectMeta):
 
-    def __init__(self, **kwargs):
+    __slots__ = ('__weakref__',)
 
-        for name, jsattr in self._object_attributes.items():
-            if name in kwargs:
-                setattr(self, name, kwargs[name])
-            elif jsattr.optional:
-                setattr(self, name, None)
-            else:
-                classname = self.__class__.__name__
-                raise TypeError(
-                    "{} missing a required argument '{}'"
-                    .format(classname, name)
-                )
+    @_specializable
+    def __init__(self, **kwargs):
 
-        # Calling set() on a dict creates a set of its keys
-        unused = set(kwargs) - set(self._object_attributes)
-        if len(unused) > 0:
+        # Check types inline and store directly, skipping the extra lookups
+        # Object.__setattr__ would make for each attribute, unless another
+        # class overrides __setattr__ and so must see every value
+        if self._object_direct_store:
+            store = object.__setattr__
+        else:
+            store = setattr
+        for name, attr_type, optional, type_error in self._object_validators:
+            value = kwargs.get(name, _MISSING)
+            if value is _MISSING:
+                if not optional:
+                    classname = self.__class__.__name__
+                    raise TypeError(
+                        "{} missing a required argument '{}'"
+                        .format(classname, name)
+                    )
+                value = None
+            elif (type(value) is not attr_type and
+                    not isinstance(value, attr_type)):
+                if not (value is None and optional):
+                    raise TypeError(type_error)
+            store(self, name, value)
+
+        # Key views compare against sets without building a set of their own
+        names = self._object_attributes_frozenset
+        if not kwargs.keys() <= names:
+            unused = set(kwargs) - names
             classname = self.__class__.__name__
             raise TypeError(
                 "{} got unexpected keyword argument(s) {}"
@@ -408,40 +1353,44 @@ class Object(Serializable, metaclass=ObjectMeta):
             )
 
     def __setattr__(self, name, value):
-        if name not in self._object_attributes:
-            raise AttributeError('{} is not a valid attribute'.format(name))
-        jsattr = self._object_attributes[name]
-        if jsattr.optional:
-            if not (isinstance(value, jsattr.type) or value is None):
-                raise TypeError(
-                    '{} must be a {} or None'.format(name, jsattr.type)
-                )
-        else:
-            if not isinstance(value, jsattr.type):
-                raise TypeError('{} must be a {}'.format(name, jsattr.type))
+        try:
+            jsattr = self._object_attributes[name]
+        except KeyError:
+            raise AttributeError(
+                '{} is not a valid attribute'.format(name)
+            ) from None
+        attr_type = jsattr.type
+        # Exact type matches skip the comparatively slow ABC isinstance()
+        if type(value) is not attr_type and not isinstance(value, attr_type):
+            if not (value is None and jsattr.optional):
+                raise TypeError(self._object_type_errors[name])
         super().__setattr__(name, value)
 
+    @_specializable
     def __repr__(self):
         parts = []
-        for name in self._object_attributes:
+        for name in self._object_attributes_names:
             value = getattr(self, name)
             parts.append('{}={}'.format(name, repr(value)))
         return '{}({})'.format(self.__class__.__name__, ', '.join(parts))
 
+    @_specializable
     def __eq__(self, other):
         if type(self) != type(other):
             return False
-        for name in self._object_attributes:
-            if getattr(self, name) != getattr(other, name):
-                return False
-        return True
+        # Compares every attribute in one C level tuple comparison
+        values = self._object_values
+        return values(self) == values(other)
+
+    schema = classmethod(_copy_cached_schema)
 
     @classmethod
-    def schema(cls):
+    @_cache_on_class('_cached_schema')
+    def _schema(cls):
         properties = {}
         required = []
-        for name, jsattr in cls._object_attributes.items():
-            properties[name] = schema(jsattr.type)
+        for name, jsattr in cls._object_attributes_items:
+            properties[name] = _shared_schema(jsattr.type)
             if not jsattr.optional:
                 required.append(name)
         json_schema = {
@@ -453,20 +1402,32 @@ class Object(Serializable, metaclass=ObjectMeta):
             json_schema['required'] = required
         return json_schema
 
+    @_specializable
     def serialize(self):
         properties = {}
-        for name, jsattr in self._object_attributes.items():
+        for name, optional, serialize_value in self._object_serializers:
             value = getattr(self, name)
-            if value is None and jsattr.optional:
+            if value is None and optional:
                 continue
-            properties[name] = serialize(value)
+            if serialize_value is not None:
+                value = serialize_value(value)
+            properties[name] = value
         return properties
 
     @classmethod
-    def deserialize(cls, data: dict):
-        jsonschema.validate(data, cls.schema())
+    @_optional_validation
+    def deserialize(cls, data: dict, validate=True):
+        if validate:
+            cls._validator()(data)
+            deserializers = cls._object_deserializers
+        else:
+            deserializers = cls._object_unvalidated_deserializers
         kwargs = {}
         for name, value in data.items():
-            jsattr = cls._object_attributes[name]
-            kwargs[name] = deserialize(value, jsattr.type)
+            deserialize_value = deserializers.get(name)
+            # Unknown names, only found in unvalidated data, are passed on
+            # for the constructor to reject
+            if deserialize_value is not None:
+                value = deserialize_value(value)
+            kwargs[name] = value
         return cls(**kwargs)
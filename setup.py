@@ -13,5 +13,9 @@ setup(
     packages=find_packages(),
     install_requires=[
         'jsonschema'
-    ]
+    ],
+    extras_require={
+        'fast': ['fastjsonschema>=2.19'],
+        'rust': ['jsonschema-rs>=0.23']
+    }
 )
@@ -1,3 +1,4 @@
+from weakref import ref
 import pytest
 from jsonserializable import Attribute
 
@@ -16,3 +17,8 @@ def test_invalid_type():
 def test_repr():
     attr = Attribute(int)
     assert repr(attr) == 'Attribute(type={}, optional=False)'.format(repr(int))
+
+
+def test_weakref():
+    attribute = Attribute(int)
+    assert ref(attribute)() is attribute
@@ -7,6 +7,7 @@ from jsonserializable import Dict
 def test_serialize(data):
     obj = Dict[int](data)
     assert obj.serialize() == data
+    assert type(obj.serialize()) is dict
 
 
 @pytest.mark.parametrize('data', [{}, {'one': 1, 'two': 2}])
@@ -22,6 +23,11 @@ def test_schema():
     }
 
 
+def test_deserialize_converts_values():
+    obj = Dict[float].deserialize({'one': 1, 'two': 2.5})
+    assert [type(value) for value in obj.values()] == [float, float]
+
+
 @pytest.mark.parametrize('data', [
     {'one': 'foo'},
     {'one': 1, 'two': 'bar'},
@@ -32,6 +38,15 @@ def test_construct_invalid_type(data):
         Dict[int](data)
 
 
+class Key(str):
+    pass
+
+
+def test_construct_subclass_entries():
+    data = {Key('one'): True, 'two': 2}
+    assert Dict[int](data) == data
+
+
 @pytest.mark.parametrize('data', [
     {'one': 'foo'},
     {'one': 1, 'two': 'bar'},
@@ -48,6 +63,11 @@ def test_deserialize_invalid_key_type():
         Dict[int].deserialize({1: 1})
 
 
+def test_deserialize_without_validation_invalid():
+    with pytest.raises(TypeError):
+        Dict[str].deserialize({'foo': 5}, validate=False)
+
+
 def test_repr():
     assert repr(Dict[int](one=1)) == "Dict[int]({'one': 1})"
 
@@ -77,6 +97,12 @@ def test_no_type_argument():
         Dict()
 
 
+@pytest.mark.parametrize('validate', [True, False])
+def test_deserialize_no_type_argument(validate):
+    with pytest.raises(TypeError):
+        Dict.deserialize({}, validate=validate)
+
+
 @pytest.mark.parametrize('typearg', [bytes, 'foo'])
 def test_unsupported_type_argument(typearg):
     with pytest.raises(TypeError):
@@ -102,6 +128,70 @@ def test_isinstance_false():
     assert not isinstance(Dict[int](one=1), IntDict)
 
 
+class CheckedValueDict(Dict[int]):  # type: ignore
+
+    @classmethod
+    def _check_type(cls, item):
+        super()._check_type(item)
+        if item < 0:
+            raise TypeError('entries must not be negative')
+
+
+def test_construct_subclass_check():
+    assert CheckedValueDict(foo=1) == {'foo': 1}
+    assert CheckedValueDict(Dict[int](foo=1)) == {'foo': 1}
+    with pytest.raises(TypeError):
+        CheckedValueDict(Dict[int](foo=-1))
+    with pytest.raises(TypeError):
+        CheckedValueDict().update(Dict[int](foo=-1))
+    with pytest.raises(TypeError):
+        CheckedValueDict(foo=-1)
+
+
+class CheckedKeyDict(Dict[int]):  # type: ignore
+
+    @staticmethod
+    def _check_key_type(key):
+        Dict._check_key_type(key)
+        if not key.islower():
+            raise TypeError('keys must be lower case')
+
+
+def test_construct_subclass_key_check():
+    assert CheckedKeyDict(foo=1) == {'foo': 1}
+    with pytest.raises(TypeError):
+        CheckedKeyDict(Foo=1)
+    with pytest.raises(TypeError):
+        CheckedKeyDict(Dict[int](Foo=1))
+    with pytest.raises(TypeError):
+        CheckedKeyDict().update(Foo=1)
+
+
+def test_setitem_subclass():
+    obj = CheckedValueDict()
+    obj['foo'] = 1
+    assert obj == {'foo': 1}
+    with pytest.raises(TypeError):
+        obj['bar'] = -1
+
+
+class PositiveDict(Dict):
+
+    @classmethod
+    def _check_type(cls, item):
+        super()._check_type(item)
+        if item < 0:
+            raise TypeError('entries must not be negative')
+
+
+def test_setitem_parameterized_subclass():
+    obj = PositiveDict[int]()
+    obj['foo'] = 1
+    assert obj == {'foo': 1}
+    with pytest.raises(TypeError):
+        obj['bar'] = -1
+
+
 @pytest.mark.parametrize('cls', [Dict[int], IntDict])
 def test_issubclass_true(cls):
     assert issubclass(cls, Dict)
@@ -110,3 +200,105 @@ def test_issubclass_true(cls):
 
 def test_issubclass_false():
     assert not issubclass(Dict[int], IntDict)
+
+
+def test_serialize_nested():
+    obj = Dict[Dict[int]](foo=Dict[int](one=1))
+    assert obj.serialize() == {'foo': {'one': 1}}
+
+
+def test_deserialize_nested():
+    obj = Dict[Dict[int]].deserialize({'foo': {'one': 1}})
+    assert obj == Dict[Dict[int]](foo=Dict[int](one=1))
+    assert type(obj['foo']) is Dict[int]
+
+
+def test_type_argument_cached():
+    assert Dict[int] is Dict[int]
+
+
+@pytest.mark.parametrize('args, kwargs', [
+    (({'two': 2},), {}),
+    (([('two', 2)],), {}),
+    ((), {'two': 2}),
+    ((Dict[int](two=2),), {}),
+    ((IntDict(two=2),), {})
+])
+def test_update(args, kwargs):
+    obj = Dict[int](one=1)
+    obj.update(*args, **kwargs)
+    assert obj == Dict[int](one=1, two=2)
+
+
+@pytest.mark.parametrize('args, kwargs', [
+    (({'two': 'bar'},), {}),
+    (({1: 2},), {}),
+    ((), {'two': 'bar'}),
+    ((Dict[str](two='bar'),), {})
+])
+def test_update_invalid_type(args, kwargs):
+    obj = Dict[int](one=1)
+    with pytest.raises(TypeError):
+        obj.update(*args, **kwargs)
+    assert obj == Dict[int](one=1)
+
+
+def test_setdefault():
+    obj = Dict[int](one=1)
+    assert obj.setdefault('one', 10) == 1
+    assert obj.setdefault('two', 2) == 2
+    assert obj == Dict[int](one=1, two=2)
+
+
+@pytest.mark.parametrize('key, default', [('two', None), ('two', 'bar'),
+                                          (2, 2)])
+def test_setdefault_invalid_type(key, default):
+    obj = Dict[int](one=1)
+    with pytest.raises(TypeError):
+        obj.setdefault(key, default)
+
+
+@pytest.mark.parametrize('source', [Dict[int](one=1), IntDict(one=1),
+                                    Dict[bool](one=True)])
+def test_construct_from_typed(source):
+    assert Dict[int](source) == dict(source)
+
+
+@pytest.mark.parametrize('args, kwargs', [
+    ((Dict[str](one='foo'),), {}),
+    ((Dict[int](one=1),), {'two': 'bar'})
+])
+def test_construct_from_typed_invalid(args, kwargs):
+    with pytest.raises(TypeError):
+        Dict[int](*args, **kwargs)
+
+
+class StatefulInitDict(Dict[int]):  # type: ignore
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.state = 'initialized'
+
+
+def test_deserialize_custom_init():
+    obj = StatefulInitDict.deserialize({'foo': 1})
+    assert obj == {'foo': 1}
+    assert obj.state == 'initialized'
+
+
+def test_deserialize_subclass_check():
+    with pytest.raises(TypeError):
+        CheckedValueDict.deserialize({'foo': -1})
+
+
+@pytest.mark.skipif(not hasattr(dict, '__ior__'),
+                    reason='dict has no |= before Python 3.9')
+def test_ior():
+    obj = Dict[int](foo=1)
+    obj |= {'bar': 2}
+    assert obj == {'foo': 1, 'bar': 2}
+    assert type(obj) is Dict[int]
+    with pytest.raises(TypeError):
+        obj |= {'baz': 'x'}
+    with pytest.raises(TypeError):
+        obj |= {1: 1}
@@ -1,3 +1,4 @@
+from weakref import ref
 import pytest
 from pytest_mock import mocker
 from jsonschema import ValidationError
@@ -118,3 +119,37 @@ def test_schema_enum():
 
 def test_schema_member():
     assert ExampleEnum.foo.schema() == {'enum': ['bar', 1,[1, 2]]}
+
+
+def test_schema_enum_cached():
+    assert ExampleEnum._schema() is ExampleEnum._schema()
+
+
+def test_schema_enum_copied():
+    ExampleEnum.schema()['enum'].append('baz')
+    ExampleEnum.foo.schema()['enum'].append('baz')
+    assert ExampleEnum.schema() == {'enum': ['bar', 1, [1, 2]]}
+    assert ExampleEnum.foo.schema() == {'enum': ['bar', 1, [1, 2]]}
+
+
+def test_member_slots():
+    assert not hasattr(ExampleEnum.foo, '__dict__')
+    assert ref(ExampleEnum.foo)() is ExampleEnum.foo
+
+
+class ShadowingEnum(Enum):
+    schema = 'foo'
+
+
+def test_member_does_not_shadow_method():
+    assert ShadowingEnum['schema'].value == 'foo'
+    assert ShadowingEnum.schema() == {'enum': ['foo']}
+
+
+class ExtendedEnum(ExampleEnum):
+    extra = 'extra'
+
+
+def test_subclass_member_attribute():
+    assert ExtendedEnum.foo is ExtendedEnum['foo']
+    assert ExtendedEnum.foo is not ExampleEnum.foo
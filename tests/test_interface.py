@@ -1,7 +1,7 @@
 from uuid import UUID, uuid4
 import pytest
 from jsonserializable import (
-    serialize, deserialize, schema, List, Dict, UUID_PATTERN
+    serialize, deserialize, schema, List, Dict, Serializable, UUID_PATTERN
 )
 
 
@@ -48,6 +48,14 @@ def test_deserialize_unsupported():
         deserialize(b'foo', bytes)
 
 
+@pytest.mark.parametrize('data, python_type', [
+    ('1', int), (5, str), (1, bool), (1, UUID)
+])
+def test_deserialize_without_validation_invalid(data, python_type):
+    with pytest.raises(TypeError):
+        deserialize(data, python_type, validate=False)
+
+
 @pytest.mark.parametrize('python_type, expected', [
     (int, {'type': 'number'}),
     (float, {'type': 'number'}),
@@ -64,3 +72,14 @@ def test_schema(python_type, expected):
 def test_schema_unsupported():
     with pytest.raises(TypeError):
         schema(bytes)
+
+
+def test_schema_registered_after_lookup():
+    class Registered:
+        @staticmethod
+        def schema():
+            return {'type': 'null'}
+    with pytest.raises(TypeError):
+        schema(Registered)
+    Serializable.register(Registered)
+    assert schema(Registered) == {'type': 'null'}
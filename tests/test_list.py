@@ -1,12 +1,13 @@
 import pytest
 from jsonschema import ValidationError
-from jsonserializable import List
+from jsonserializable import List, Dict
 
 
 @pytest.mark.parametrize('data', [[], [1, 2, 3]])
 def test_serialize(data):
     obj = List[int](data)
     assert obj.serialize() == data
+    assert type(obj.serialize()) is list
 
 
 @pytest.mark.parametrize('data', [[], [1, 2, 3]])
@@ -22,12 +23,46 @@ def test_schema():
     }
 
 
+def test_deserialize_converts_entries():
+    obj = List[float].deserialize([1, 2.5])
+    assert [type(entry) for entry in obj] == [float, float]
+
+
+def test_deserialize_without_validation(mocker):
+    validator = mocker.patch.object(List[int], '_validator')
+    assert List[int].deserialize([1, 2], validate=False) == [1, 2]
+    validator.assert_not_called()
+
+
+@pytest.mark.parametrize('python_type, data', [
+    (str, [5]), (int, ['1']), (float, [True])
+])
+def test_deserialize_without_validation_invalid(python_type, data):
+    with pytest.raises(TypeError):
+        List[python_type].deserialize(data, validate=False)
+
+
+def test_deserialize_without_validation_converts_numbers():
+    obj = List[float].deserialize([1, 2.5], validate=False)
+    assert obj == [1.0, 2.5]
+    assert type(obj[0]) is float
+
+
+def test_deserialize_iterator_without_validation():
+    assert List[int].deserialize(iter([1, 2]), validate=False) == [1, 2]
+
+
 @pytest.mark.parametrize('data', [['foo'], [1, 2, 'bar']])
 def test_construct_invalid_type(data):
     with pytest.raises(TypeError):
         List[int](data)
 
 
+@pytest.mark.parametrize('data', [[True, 1], [1, 2, False]])
+def test_construct_subclass_entries(data):
+    assert List[int](data) == data
+
+
 @pytest.mark.parametrize('data', [['foo'], [1, 2, 'bar'], {}, 1])
 def test_deserialize_invalid_schema(data):
     with pytest.raises(ValidationError):
@@ -71,6 +106,12 @@ def test_no_type_argument():
         List()
 
 
+@pytest.mark.parametrize('validate', [True, False])
+def test_deserialize_no_type_argument(validate):
+    with pytest.raises(TypeError):
+        List.deserialize([1], validate=validate)
+
+
 @pytest.mark.parametrize('typearg', [bytes, 'foo'])
 def test_unsupported_type_argument(typearg):
     with pytest.raises(TypeError):
@@ -104,3 +145,120 @@ def test_issubclass_true(cls):
 
 def test_issubclass_false():
     assert not issubclass(List[int], IntList)
+
+
+@pytest.mark.parametrize('data', [[[]], [[1, 2], [3]]])
+def test_serialize_nested(data):
+    obj = List[List[int]](List[int](item) for item in data)
+    assert obj.serialize() == data
+
+
+@pytest.mark.parametrize('data', [[[]], [[1, 2], [3]]])
+def test_deserialize_nested(data):
+    obj = List[List[int]].deserialize(data)
+    assert obj == List[List[int]](List[int](item) for item in data)
+    assert all(type(item) is List[int] for item in obj)
+
+
+def test_type_argument_cached():
+    assert List[int] is List[int]
+
+
+def test_append():
+    obj = List[int]([1, 2])
+    obj.append(3)
+    assert obj == List[int]([1, 2, 3])
+
+
+@pytest.mark.parametrize('data', ['foo', [], [1]])
+def test_append_invalid_type(data):
+    obj = List[int]([1, 2])
+    with pytest.raises(TypeError):
+        obj.append(data)
+
+
+@pytest.mark.parametrize('values', [
+    [3, 4], (3, 4), iter([3, 4]), List[int]([3, 4]), IntList([3, 4])
+])
+def test_extend(values):
+    obj = List[int]([1, 2])
+    obj.extend(values)
+    assert obj == List[int]([1, 2, 3, 4])
+
+
+@pytest.mark.parametrize('values', [
+    [3, 'foo'], List[str](['foo']), Dict[int](foo=1)
+])
+def test_extend_invalid_type(values):
+    obj = List[int]([1, 2])
+    with pytest.raises(TypeError):
+        obj.extend(values)
+    assert obj == List[int]([1, 2])
+
+
+def test_iadd():
+    obj = List[int]([1, 2])
+    original = obj
+    obj += [3]
+    assert obj is original
+    assert obj == List[int]([1, 2, 3])
+
+
+def test_iadd_invalid_type():
+    obj = List[int]([1, 2])
+    with pytest.raises(TypeError):
+        obj += ['foo']
+
+
+@pytest.mark.parametrize('source', [List[int]([1, 2]), IntList([1, 2]),
+                                    List[bool]([True, False])])
+def test_construct_from_typed(source):
+    assert List[int](source) == list(source)
+
+
+def test_construct_from_typed_invalid():
+    with pytest.raises(TypeError):
+        List[int](List[str](['foo']))
+
+
+class CheckedList(List[int]):  # type: ignore
+
+    @classmethod
+    def _check_type(cls, item):
+        super()._check_type(item)
+        if item < 0:
+            raise TypeError('entries must not be negative')
+
+
+def test_construct_subclass_check():
+    assert CheckedList([1]) == [1]
+    assert CheckedList(List[int]([1])) == [1]
+    with pytest.raises(TypeError):
+        CheckedList(List[int]([-1]))
+    with pytest.raises(TypeError):
+        CheckedList([-1])
+    with pytest.raises(TypeError):
+        CheckedList([1]).extend([-1])
+    with pytest.raises(TypeError):
+        CheckedList([1]).extend(List[int]([-1]))
+    obj = CheckedList([1])
+    with pytest.raises(TypeError):
+        obj += List[int]([-1])
+
+
+class StatefulInitList(List[int]):  # type: ignore
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.state = 'initialized'
+
+
+def test_deserialize_custom_init():
+    obj = StatefulInitList.deserialize([1])
+    assert obj == [1]
+    assert obj.state == 'initialized'
+
+
+def test_deserialize_subclass_check():
+    with pytest.raises(TypeError):
+        CheckedList.deserialize([-1])
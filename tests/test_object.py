@@ -1,6 +1,7 @@
+from uuid import UUID, uuid4
 import pytest
 from jsonschema import ValidationError
-from jsonserializable import Object, Attribute
+from jsonserializable import Object, Attribute, List
 
 
 class ExampleObject(Object):
@@ -30,6 +31,23 @@ def test_not_equal(value2):
     assert value1 != value2
 
 
+class EmptyObject(Object):
+    pass
+
+
+class SingleAttributeObject(Object):
+    integer = Attribute(int)
+
+
+def test_equal_no_attributes():
+    assert EmptyObject() == EmptyObject()
+
+
+def test_equal_single_attribute():
+    assert SingleAttributeObject(integer=1) == SingleAttributeObject(integer=1)
+    assert SingleAttributeObject(integer=1) != SingleAttributeObject(integer=2)
+
+
 def test_serialize():
     obj = ExampleObject(integer=1, string='foo')
     assert obj.serialize() == {'integer': 1, 'string': 'foo'}
@@ -123,3 +141,255 @@ def test_setattr_nonexistent_attribute():
     obj = ExampleObject(integer=1, string='foo')
     with pytest.raises(AttributeError):
         obj.non_existent = 1
+
+
+def test_schema_cached():
+    assert ExampleObject._schema() is ExampleObject._schema()
+
+
+def test_schema_copied():
+    ExampleObject.schema()['required'].append('extra')
+    NestedObject.schema()['properties']['example']['required'].append('x')
+    assert ExampleObject.schema()['required'] == ['integer', 'string']
+    obj = ExampleObject.deserialize({'integer': 1, 'string': 'foo'})
+    assert obj == ExampleObject(integer=1, string='foo')
+
+
+def test_schema_subclass_not_shared():
+    class ExtendedObject(ExampleObject):
+        extra = Attribute(int)
+    ExampleObject.schema()
+    assert 'extra' in ExtendedObject.schema()['properties']
+    assert 'extra' not in ExampleObject.schema()['properties']
+
+
+class CustomInitObject(ExampleObject):
+    extra = Attribute(int, optional=True)
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('extra', 0)
+        super().__init__(**kwargs)
+
+
+def test_custom_init_equal():
+    obj = CustomInitObject(integer=1, string='foo')
+    assert obj == CustomInitObject(integer=1, string='foo')
+    assert obj != CustomInitObject(integer=1, string='foo', extra=1)
+    assert obj != ExampleObject(integer=1, string='foo')
+
+
+def test_custom_init_super():
+    obj = CustomInitObject(integer=1, string='foo')
+    assert obj.extra == 0
+    assert obj.serialize() == {'integer': 1, 'string': 'foo', 'extra': 0}
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'integer': 'foo', 'string': 'foo'},
+    {'integer': 1, 'string': 'foo', 'extra': 'bar'},
+    {'string': 'foo'}
+])
+def test_custom_init_super_invalid(kwargs):
+    with pytest.raises(TypeError):
+        CustomInitObject(**kwargs)
+
+
+class StrippingObject(Object):
+    string = Attribute(str)
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value.strip())
+
+
+def test_custom_setattr_init():
+    assert StrippingObject(string='  foo  ').string == 'foo'
+
+
+class StrippingMixin:
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value.strip())
+
+
+class StrippingMixinObject(Object, StrippingMixin):
+    string = Attribute(str)
+
+
+def test_mixin_setattr():
+    obj = StrippingMixinObject(string='  foo  ')
+    assert obj.string == 'foo'
+    obj.string = '  bar  '
+    assert obj.string == 'bar'
+
+
+class CustomSerializeObject(Object):
+    integer = Attribute(int)
+
+    def serialize(self):
+        return self.integer
+
+
+class CustomSerializeSubclass(CustomSerializeObject):
+    string = Attribute(str)
+
+
+def test_custom_serialize_inherited():
+    obj = CustomSerializeSubclass(integer=1, string='foo')
+    assert obj.serialize() == 1
+
+
+class NestedObject(Object):
+    example = Attribute(ExampleObject)
+    identifier = Attribute(UUID)
+    values = Attribute(List[int], optional=True)
+
+
+def test_deserialize_nested():
+    identifier = uuid4()
+    obj = NestedObject.deserialize({
+        'example': {'integer': 1, 'string': 'foo'},
+        'identifier': str(identifier),
+        'values': [1, 2]
+    })
+    assert obj == NestedObject(
+        example=ExampleObject(integer=1, string='foo'),
+        identifier=identifier,
+        values=List[int]([1, 2])
+    )
+
+
+class InnerObject(Object):
+    integer = Attribute(int)
+
+
+class OuterObject(Object):
+    inner = Attribute(InnerObject)
+
+
+def test_deserialize_nested_validated_once():
+    obj = OuterObject.deserialize({'inner': {'integer': 1}})
+    assert obj == OuterObject(inner=InnerObject(integer=1))
+    assert '_cached_validator' in OuterObject.__dict__
+    assert '_cached_validator' not in InnerObject.__dict__
+
+
+def test_deserialize_without_validation(mocker):
+    validator = mocker.patch.object(ExampleObject, '_validator')
+    obj = ExampleObject.deserialize({'integer': 1, 'string': 'foo'},
+                                    validate=False)
+    assert obj == ExampleObject(integer=1, string='foo')
+    validator.assert_not_called()
+
+
+@pytest.mark.parametrize('data', [
+    {'integer': '1', 'string': 'foo'},
+    {'integer': 1, 'string': 5},
+    {'integer': 1, 'string': 'foo', 'extra': 1}
+])
+def test_deserialize_without_validation_invalid(data):
+    with pytest.raises(TypeError):
+        ExampleObject.deserialize(data, validate=False)
+
+
+def test_schema_nested_shared():
+    properties = NestedObject._schema()['properties']
+    assert properties['example'] is ExampleObject._schema()
+    assert properties['values'] is List[int]._schema()
+
+
+def test_slots():
+    obj = OtherObject(integer=1, string='foo')
+    assert not hasattr(obj, '__dict__')
+    assert OtherObject.__slots__ == ()
+
+
+class DeclaredSlotsObject(Object):
+    __slots__ = ('integer',)
+    integer = Attribute(int)
+
+
+class EmptySlotsObject(Object):
+    __slots__ = ()
+    integer = Attribute(int)
+
+
+class ShadowingObject(ExampleObject):
+    integer = 5
+
+
+def test_declared_slots():
+    obj = DeclaredSlotsObject(integer=1)
+    assert obj.integer == 1
+    assert not hasattr(obj, '__dict__')
+
+
+def test_declared_slots_missing_attribute():
+    obj = EmptySlotsObject(integer=1)
+    assert obj.integer == 1
+    assert obj.__dict__ == {'integer': 1}
+
+
+def test_shadowed_slot():
+    obj = ShadowingObject(integer=3, string='foo')
+    assert obj.integer == 3
+    obj.integer = 4
+    assert obj.serialize() == {'integer': 4, 'string': 'foo'}
+
+
+class DictObject(ExampleObject):
+    _use_dict = True
+    extra = Attribute(int, optional=True)
+
+
+def test_use_dict():
+    obj = DictObject(integer=1, string='foo', extra=2)
+    assert obj.__dict__ == {'extra': 2}
+    assert obj.serialize() == {'integer': 1, 'string': 'foo', 'extra': 2}
+    with pytest.raises(AttributeError):
+        obj.non_existent = 1
+
+
+def test_serialize_nested():
+    identifier = uuid4()
+    obj = NestedObject(
+        example=ExampleObject(integer=1, string='foo'),
+        identifier=identifier,
+        values=List[int]([1, 2])
+    )
+    assert obj.serialize() == {
+        'example': {'integer': 1, 'string': 'foo'},
+        'identifier': str(identifier),
+        'values': [1, 2]
+    }
+
+
+class InterleavedObject(Object):
+    first = Attribute(int)
+    second = Attribute(int, optional=True)
+    third = Attribute(int)
+
+
+def test_serialize_key_order():
+    obj = InterleavedObject(first=1, second=2, third=3)
+    assert list(obj.serialize()) == ['first', 'second', 'third']
+
+
+class ExtendingSerializeObject(NestedObject):
+
+    def serialize(self):
+        properties = super().serialize()
+        properties['extended'] = True
+        return properties
+
+
+def test_serialize_super():
+    identifier = uuid4()
+    obj = ExtendingSerializeObject(
+        example=ExampleObject(integer=1, string='foo'),
+        identifier=identifier
+    )
+    assert obj.serialize() == {
+        'example': {'integer': 1, 'string': 'foo'},
+        'identifier': str(identifier),
+        'extended': True
+    }
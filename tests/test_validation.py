@@ -0,0 +1,158 @@
+import pytest
+import jsonschema
+from jsonschema import ValidationError
+import jsonserializable
+from jsonserializable import _compile_validator, _compile_backend_validator
+
+
+EXAMPLE_SCHEMA = {
+    'type': 'object',
+    'properties': {'integer': {'type': 'number'}},
+    'required': ['integer'],
+    'additionalProperties': False
+}
+
+
+DRAFT_07 = 'http://json-schema.org/draft-07/schema#'
+BACKENDS = ['jsonschema', 'fastjsonschema', 'jsonschema_rs']
+
+
+def use_backend(backend, monkeypatch):
+    for other in ['fastjsonschema', 'jsonschema_rs']:
+        if other == backend:
+            pytest.importorskip(other)
+        else:
+            monkeypatch.setattr(jsonserializable, other, None)
+
+
+@pytest.fixture(params=['generated'] + BACKENDS)
+def compile_validator(request, monkeypatch):
+    if request.param == 'generated':
+        return _compile_validator
+    use_backend(request.param, monkeypatch)
+    if request.param == 'fastjsonschema':
+        # fastjsonschema is only used for schemas declaring a draft
+        return lambda json_schema: _compile_backend_validator(
+            dict(json_schema, **{'$schema': DRAFT_07})
+        )
+    return _compile_backend_validator
+
+
+def test_valid(compile_validator):
+    compile_validator(EXAMPLE_SCHEMA)({'integer': 1})
+
+
+@pytest.mark.parametrize('data', [
+    {'integer': 'foo'},
+    {'integer': True},
+    {},
+    {'integer': 1, 'extra': 1},
+    []
+])
+def test_invalid(compile_validator, data):
+    with pytest.raises(ValidationError):
+        compile_validator(EXAMPLE_SCHEMA)(data)
+
+
+def test_format_not_checked(compile_validator):
+    compile_validator({'type': 'string', 'format': 'email'})('foo')
+
+
+def test_default_not_filled(compile_validator):
+    data = {}
+    compile_validator({
+        'type': 'object',
+        'properties': {'integer': {'type': 'number', 'default': 1}}
+    })(data)
+    assert data == {}
+
+
+PARITY_SCHEMAS = [
+    EXAMPLE_SCHEMA,
+    {'type': 'array', 'items': {'type': 'boolean'}},
+    {'type': 'object', 'additionalProperties': {'type': 'string'}},
+    {'type': 'string', 'pattern': '^a%b'},
+    {'required': ['foo'], 'properties': {'bar': {'type': 'number'}}},
+    {'items': {'enum': [1, 'foo']}},
+    {'type': 'array', 'items': {'type': 'number', 'minimum': 0}},
+    {'type': ['string', 'null']},
+    {'type': 'array', 'items': {'type': ['number', 'boolean']}}
+]
+PARITY_DATA = [
+    None, True, 1, 1.5, 'foo', 'a%b', [], [True, 1], [1, 'foo'], [-1, 2],
+    {}, {'foo': 'bar'}, {'integer': 1}, {'integer': 1.5, 'foo': 1},
+    {'bar': 1}, {'foo': 1, 'bar': 'baz'}
+]
+
+
+@pytest.mark.parametrize('json_schema', PARITY_SCHEMAS)
+@pytest.mark.parametrize('data', PARITY_DATA)
+def test_generated_matches_jsonschema(json_schema, data):
+    try:
+        jsonschema.validate(data, json_schema)
+    except ValidationError:
+        with pytest.raises(ValidationError):
+            _compile_validator(json_schema)(data)
+    else:
+        _compile_validator(json_schema)(data)
+
+
+BACKEND_PARITY_SCHEMAS = PARITY_SCHEMAS + [
+    {'type': 'array', 'prefixItems': [{'type': 'string'}]},
+    {'$schema': DRAFT_07, 'type': 'array', 'items': {'type': 'string'}},
+    {'$schema': DRAFT_07, 'required': ['foo'],
+     'properties': {'bar': {'type': 'number'}}}
+]
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('json_schema', BACKEND_PARITY_SCHEMAS)
+@pytest.mark.parametrize('data', PARITY_DATA)
+def test_backend_matches_jsonschema(backend, json_schema, data,
+                                    monkeypatch):
+    use_backend(backend, monkeypatch)
+    try:
+        jsonschema.validate(data, json_schema)
+    except ValidationError:
+        with pytest.raises(ValidationError):
+            _compile_backend_validator(json_schema)(data)
+    else:
+        _compile_backend_validator(json_schema)(data)
+
+
+def test_reference_not_generated():
+    validate = _compile_validator({
+        'definitions': {'number': {'type': 'number'}},
+        'items': {'$ref': '#/definitions/number'}
+    })
+    validate([1])
+    with pytest.raises(ValidationError):
+        validate(['foo'])
+
+
+def nested_schema(depth, wrap):
+    json_schema = {'type': 'number'}
+    for _ in range(depth):
+        json_schema = wrap(json_schema)
+    return json_schema
+
+
+def nested_data(depth, wrap):
+    data = 1
+    for _ in range(depth):
+        data = wrap(data)
+    return data
+
+
+@pytest.mark.parametrize('wrap_schema, wrap_data', [
+    (lambda s: {'type': 'array', 'items': s}, lambda d: [d]),
+    (lambda s: {'type': 'object', 'properties': {'foo': s}},
+     lambda d: {'foo': d}),
+    (lambda s: {'type': 'object', 'additionalProperties': s},
+     lambda d: {'foo': d})
+])
+def test_deep_nesting(wrap_schema, wrap_data):
+    validate = _compile_validator(nested_schema(120, wrap_schema))
+    validate(nested_data(120, wrap_data))
+    with pytest.raises(ValidationError):
+        validate(nested_data(119, wrap_data))